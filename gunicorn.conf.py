@@ -0,0 +1,27 @@
+"""
+Gunicorn-Konfiguration fuer den Dashboard-Server (Mehrprozess-Betrieb).
+
+    gunicorn -c gunicorn.conf.py
+
+Jeder Worker-Prozess haelt einen eigenen PersonEstimator; Aenderungen an der
+Kalibrierung werden ueber calibration.json/.journal (mit Dateisperre)
+zwischen den Prozessen abgeglichen. Der Backfill-Thread laeuft nur in dem
+Worker, der die Sperre backfill_state.json.lock haelt.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "app:app"
+bind = os.environ.get("DASHBOARD_BIND", "0.0.0.0:5000")
+
+# Ein Prozess pro Kern; Threads fuer die langlebigen SSE-Verbindungen (/api/stream)
+workers = int(os.environ.get("DASHBOARD_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = 8
+timeout = 120
+
+# Nicht vorladen: jeder Worker oeffnet Sperrdateien, Pool und Threads selbst
+preload_app = False
+
+accesslog = "-"